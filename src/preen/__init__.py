@@ -1,7 +1,5 @@
 """Preen — conformance and adoption CLI for the py-canon fleet standard."""
 
-from importlib.metadata import version as _get_version
-
 
 def __getattr__(name: str) -> str:
     """Lazily expose the package version.
@@ -16,5 +14,8 @@ def __getattr__(name: str) -> str:
         AttributeError: If any other attribute is requested.
     """
     if name == "__version__":
-        return _get_version(__name__)
+        # Deferred: importlib.metadata dominates the package's import time
+        from importlib.metadata import version
+
+        return version(__name__)
     raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -6,6 +6,8 @@ the repo, and rewrites the ``[tool.*]`` sections of pyproject.toml with
 tomlkit so comments and ordering elsewhere survive.
 """
 
+import filecmp
+import os
 import re
 import shutil
 import subprocess
@@ -18,6 +20,8 @@ from typing import Any
 import tomlkit
 from tomlkit.items import Table
 
+from .config import clear_pyproject_cache, load_pyproject
+
 CANON_TEMPLATE = "gh:gojiplus/py-canon"
 
 # [tool.*] sections replaced wholesale with the template's values.
@@ -51,6 +55,8 @@ allow-init-docstring = true
 exclude = '\\.venv|tests|docs'
 """
 
+# [tool.*] sections taken from CANON_TOOL_TOML, and retired ones to delete.
+CANON_TOOL_SECTIONS = ("ruff", "pyright", "pydoclint")
 LEGACY_TOOL_SECTIONS = ("black", "isort", "flake8", "mypy")
 
 DEV_GROUP_REQUIRED = {
@@ -130,6 +136,21 @@ def _git(repo: Path, *args: str) -> str | None:
     return result.stdout.strip()
 
 
+def _dir_name(repo: Path) -> str:
+    """Return the repo directory's name, even when given as ``.``.
+
+    Uses ``os.path.abspath`` rather than ``Path.resolve``: only the final
+    component is needed, so there is no reason to walk symlinks on disk.
+
+    Args:
+        repo: Repository directory.
+
+    Returns:
+        The last component of the absolute path.
+    """
+    return os.path.basename(os.path.abspath(repo))
+
+
 def detect_package_name(repo: Path, project_name: str) -> str:
     """Determine the import package name for the repo.
 
@@ -172,15 +193,14 @@ def mine_answers(repo: Path) -> dict[str, Any]:
     if not pyproject_path.exists():
         raise FileNotFoundError(f"No pyproject.toml in {repo}")
 
-    with pyproject_path.open("rb") as f:
-        data = tomllib.load(f)
+    data = load_pyproject(pyproject_path)
     project = data.get("project", {})
 
-    project_name = project.get("name") or repo.resolve().name
+    project_name = project.get("name") or _dir_name(repo)
     description = project.get("description", "")
-    authors = project.get("authors", [])
-    author_name = authors[0].get("name", "") if authors else ""
-    author_email = authors[0].get("email", "") if authors else ""
+    authors = project.get("authors") or [{}]
+    author_name = authors[0].get("name", "")
+    author_email = authors[0].get("email", "")
 
     org = "gojiplus"
     remote = _git(repo, "remote", "get-url", "origin")
@@ -246,12 +266,19 @@ def copy_managed_files(
         package_name: Import name (for py.typed placement).
         report: Adoption report to record written/skipped files into.
     """
+    # Several managed files share .github/workflows/; mkdir each dir once
+    made_dirs: set[Path] = set()
+
     for rel in OVERWRITE_ALWAYS:
         src = rendered / rel
         if not src.exists():
             report.skipped.append(f"{rel} (not in template)")
             continue
-        _copy(src, repo / rel)
+        dest = repo / rel
+        if _same_contents(src, dest):
+            report.skipped.append(f"{rel} (unchanged)")
+            continue
+        _copy(src, dest, made_dirs)
         report.written.append(rel)
 
     for rel in COPY_IF_ABSENT:
@@ -263,19 +290,22 @@ def copy_managed_files(
         if dest.exists():
             report.skipped.append(f"{rel} (exists)")
             continue
-        _copy(src, dest)
+        _copy(src, dest, made_dirs)
         report.written.append(rel)
 
     # docs/conf.py: overwrite, but back up any existing config first.
     conf_src = rendered / "docs" / "conf.py"
     if conf_src.exists():
         conf_dest = repo / "docs" / "conf.py"
-        if conf_dest.exists():
+        if _same_contents(conf_src, conf_dest):
+            report.skipped.append("docs/conf.py (unchanged)")
+        elif conf_dest.exists():
             shutil.copy2(conf_dest, conf_dest.with_suffix(".py.bak"))
             report.written.append("docs/conf.py (old config saved to docs/conf.py.bak)")
+            _copy(conf_src, conf_dest, made_dirs)
         else:
             report.written.append("docs/conf.py")
-        _copy(conf_src, conf_dest)
+            _copy(conf_src, conf_dest, made_dirs)
 
     # py.typed in whichever layout the repo uses.
     if (repo / "src" / package_name).is_dir():
@@ -293,14 +323,38 @@ def copy_managed_files(
             report.written.append(str(typed.relative_to(repo)))
 
 
-def _copy(src: Path, dest: Path) -> None:
+def _same_contents(src: Path, dest: Path) -> bool:
+    """Return True if dest already holds exactly the bytes of src.
+
+    filecmp compares sizes first and then reads both files in chunks,
+    stopping at the first difference.
+
+    Args:
+        src: Rendered template file.
+        dest: Corresponding file in the repo (may not exist).
+
+    Returns:
+        Whether copying src over dest would be a no-op.
+    """
+    try:
+        return filecmp.cmp(src, dest, shallow=False)
+    except FileNotFoundError:
+        return False
+
+
+def _copy(src: Path, dest: Path, made_dirs: set[Path]) -> None:
     """Copy a file, creating parent directories.
 
     Args:
         src: Source file.
         dest: Destination file.
+        made_dirs: Directories already created during this batch of copies;
+            their mkdir is skipped and new ones are added.
     """
-    dest.parent.mkdir(parents=True, exist_ok=True)
+    parent = dest.parent
+    if parent not in made_dirs:
+        parent.mkdir(parents=True, exist_ok=True)
+        made_dirs.add(parent)
     shutil.copy2(src, dest)
 
 
@@ -357,19 +411,20 @@ def rewrite_pyproject(repo: Path, release_migration: bool = False) -> list[str]:
     if not pyproject_path.exists():
         raise FileNotFoundError(f"No pyproject.toml in {repo}")
 
-    doc = tomlkit.parse(pyproject_path.read_text(encoding="utf-8"))
+    original = pyproject_path.read_bytes()
+    doc = tomlkit.parse(original.decode("utf-8"))
     canon = tomlkit.parse(CANON_TOOL_TOML)
     changes: list[str] = []
 
     tool = _ensure_table(doc, "tool")
-    for section in ("ruff", "pyright", "pydoclint"):
+    for section in CANON_TOOL_SECTIONS:
         existed = section in tool
         tool[section] = canon["tool"][section]  # type: ignore[index]
         changes.append(f"{'replaced' if existed else 'set'} [tool.{section}]")
 
     # Point pyright at the actual package location (src/ vs flat layout)
     project = doc.get("project", {})
-    project_name = str(project.get("name", repo.resolve().name))
+    project_name = str(project.get("name") or _dir_name(repo))
     package_name = detect_package_name(repo, project_name)
     if not (repo / "src" / package_name).is_dir() and (repo / package_name).is_dir():
         tool["pyright"]["include"] = [package_name]  # type: ignore[index]
@@ -386,7 +441,11 @@ def rewrite_pyproject(repo: Path, release_migration: bool = False) -> list[str]:
     if release_migration:
         changes.extend(_migrate_release(doc, repo))
 
-    pyproject_path.write_text(tomlkit.dumps(doc), encoding="utf-8")
+    # bytes equality rejects on length before comparing content
+    updated = tomlkit.dumps(doc).encode("utf-8")
+    if updated != original:
+        pyproject_path.write_bytes(updated)
+        clear_pyproject_cache()
     return changes
 
 
@@ -489,7 +548,7 @@ def _migrate_release(doc: Any, repo: Path) -> list[str]:
     udv["vcs"] = "git"
     udv["style"] = "pep440"
 
-    project_name = str(project.get("name", repo.resolve().name))
+    project_name = str(project.get("name") or _dir_name(repo))
     package_name = detect_package_name(repo, project_name)
     if (repo / "src" / package_name).is_dir():
         packages = [f"src/{package_name}"]
@@ -555,8 +614,7 @@ def _requires_python_floor(repo: Path) -> tuple[int, int] | None:
     if not pyproject_path.exists():
         return None
     try:
-        with pyproject_path.open("rb") as f:
-            data = tomllib.load(f)
+        data = load_pyproject(pyproject_path)
     except (OSError, tomllib.TOMLDecodeError):
         return None
     requires = data.get("project", {}).get("requires-python", "")
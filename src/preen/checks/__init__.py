@@ -20,7 +20,9 @@ from .template import TemplateCheck
 from .tests import TestsCheck
 from .version import VersionCheck
 
-ALL_CHECKS: list[type[Check]] = [
+#: Built-in checks in report order: template conformance first, slow
+#: network/type checks last.
+ALL_CHECKS: tuple[type[Check], ...] = (
     TemplateCheck,
     RuffCheck,
     TestsCheck,
@@ -34,15 +36,28 @@ ALL_CHECKS: list[type[Check]] = [
     PydoclintCheck,
     PyrightCheck,
     CodespellCheck,
-]
+)
 
 __all__ = [
     "ALL_CHECKS",
+    "CIMatrixCheck",
     "Check",
     "CheckResult",
+    "CitationCheck",
+    "CodespellCheck",
+    "DepsCheck",
+    "DeptreeCheck",
     "Fix",
     "Impact",
     "Issue",
+    "LinkCheck",
+    "PydoclintCheck",
+    "PyrightCheck",
+    "RuffCheck",
     "Severity",
+    "StructureCheck",
+    "TemplateCheck",
+    "TestsCheck",
+    "VersionCheck",
     "run_checks",
 ]
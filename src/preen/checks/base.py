@@ -3,16 +3,32 @@
 from abc import ABC, abstractmethod
 from collections.abc import Callable
 from dataclasses import dataclass, field
-from enum import Enum
+from enum import Enum, IntEnum
+from functools import lru_cache
 from pathlib import Path
+from typing import ClassVar
 
+from ..config import load_pyproject
 
-class Severity(Enum):
-    """Severity levels for issues."""
 
-    ERROR = "error"
-    WARNING = "warning"
-    INFO = "info"
+class Severity(IntEnum):
+    """Severity levels for issues, most severe first.
+
+    Values are integers that index the per-severity counts, not display
+    strings; use :attr:`label` for the name shown to users.
+    """
+
+    ERROR = 0
+    WARNING = 1
+    INFO = 2
+
+    @property
+    def label(self) -> str:
+        """Return the lowercase display name (e.g. ``"error"``)."""
+        return _SEVERITY_LABELS[self]
+
+
+_SEVERITY_LABELS = ("error", "warning", "info")
 
 
 class Impact(Enum):
@@ -36,6 +52,12 @@ class Fix:
         return self.diff
 
 
+@lru_cache(maxsize=128)
+def _format_prefix(severity: Severity, check: str) -> str:
+    """Return the ``[severity] check: `` prefix shared by an issue's summary."""
+    return f"[{severity.label}] {check}: "
+
+
 @dataclass
 class Issue:
     """Represents an issue found by a check."""
@@ -57,7 +79,8 @@ class Issue:
             location = f" in {self.file}"
             if self.line:
                 location += f":{self.line}"
-        return f"[{self.severity.value}] {self.check}: {self.description}{location}"
+        prefix = _format_prefix(self.severity, self.check)
+        return f"{prefix}{self.description}{location}"
 
     def get_impact_symbol(self) -> str:
         """Get emoji symbol for impact level."""
@@ -79,22 +102,48 @@ class Issue:
 
 @dataclass
 class CheckResult:
-    """Result of running a check."""
+    """Result of running a check.
+
+    Severity counts are tallied from ``issues`` at construction; append
+    further issues with :meth:`add_issue` so the counts stay in step.
+    """
 
     check: str
     passed: bool
     issues: list[Issue] = field(default_factory=list)
     duration: float = 0.0
+    #: Issue tallies indexed by Severity value.
+    counts: list[int] = field(
+        default_factory=lambda: [0] * len(Severity),
+        init=False,
+        repr=False,
+        compare=False,
+    )
+
+    def __post_init__(self) -> None:
+        """Seed the severity counts from the initial issues."""
+        counts = self.counts
+        for issue in self.issues:
+            counts[issue.severity] += 1
+
+    def add_issue(self, issue: Issue) -> None:
+        """Append an issue and update the severity counts.
+
+        Args:
+            issue: The issue to record.
+        """
+        self.issues.append(issue)
+        self.counts[issue.severity] += 1
 
     @property
     def has_errors(self) -> bool:
         """Return True if any issues are errors."""
-        return any(issue.severity == Severity.ERROR for issue in self.issues)
+        return self.counts[Severity.ERROR] > 0
 
     @property
     def has_warnings(self) -> bool:
         """Return True if any issues are warnings."""
-        return any(issue.severity == Severity.WARNING for issue in self.issues)
+        return self.counts[Severity.WARNING] > 0
 
     @property
     def has_blocking_issues(self) -> bool:
@@ -114,6 +163,10 @@ class CheckResult:
 class Check(ABC):
     """Abstract base class for all checks."""
 
+    #: Name of this check, used by --skip/--only and in reports. Declared on
+    #: the class so checks can be selected without instantiating them.
+    name: ClassVar[str]
+
     #: Directories never worth checking, regardless of repo config.
     DEFAULT_EXCLUDES = frozenset(
         {
@@ -131,6 +184,23 @@ class Check(ABC):
         }
     )
 
+    def __init_subclass__(cls, **kwargs: object) -> None:
+        """Require every concrete check to declare a ``name`` string.
+
+        Args:
+            **kwargs: Forwarded to ``object.__init_subclass__``.
+
+        Raises:
+            TypeError: If a subclass implementing ``run`` has no ``name``.
+        """
+        super().__init_subclass__(**kwargs)
+        # ABCMeta sets __abstractmethods__ only after this hook runs, so
+        # look at run() directly to tell concrete checks from abstract ones
+        if getattr(cls.run, "__isabstractmethod__", False):
+            return
+        if not isinstance(getattr(cls, "name", None), str):
+            raise TypeError(f"{cls.__name__} must define a class attribute 'name'")
+
     def __init__(self, project_dir: Path):
         """Initialize the check.
 
@@ -154,11 +224,7 @@ class Check(ABC):
                 import tomllib
 
                 try:
-                    ruff = (
-                        tomllib.loads(pyproject.read_text())
-                        .get("tool", {})
-                        .get("ruff", {})
-                    )
+                    ruff = load_pyproject(pyproject).get("tool", {}).get("ruff", {})
                 except (tomllib.TOMLDecodeError, OSError):
                     ruff = {}
                 for key in ("exclude", "extend-exclude"):
@@ -173,12 +239,6 @@ class Check(ABC):
         """Return True if path lies under an excluded directory."""
         return any(part in self.excluded_dirs() for part in path.parts)
 
-    @property
-    @abstractmethod
-    def name(self) -> str:
-        """Return the name of this check."""
-        pass
-
     @property
     def description(self) -> str:
         """Return a description of what this check does."""
@@ -196,3 +256,6 @@ class Check(ABC):
     def can_fix(self) -> bool:
         """Return True if this check can automatically fix issues."""
         return False
+
+
+#: Every built-in check class, in registration (import) order.
@@ -6,6 +6,7 @@ from pathlib import Path
 
 import yaml
 
+from ..config import load_pyproject
 from .base import Check, CheckResult, Impact, Issue, Severity
 
 CANON_SHIM_MARKER = "gojiplus/py-canon/.github/workflows/reusable-ci.yml@"
@@ -13,13 +14,15 @@ CANON_SHIM_MARKER = "gojiplus/py-canon/.github/workflows/reusable-ci.yml@"
 _FLOOR = re.compile(r">=\s*(\d+)\.(\d+)")
 
 
+def _version_key(version: str) -> tuple[int, ...]:
+    """Sort key putting '3.9' before '3.10'; non-numeric parts sort lowest."""
+    return tuple(int(part) if part.isdigit() else -1 for part in version.split("."))
+
+
 class CIMatrixCheck(Check):
     """Check that ci.yml is a py-canon shim or covers the requires-python floor."""
 
-    @property
-    def name(self) -> str:
-        """Return the name of this check."""
-        return "ci-matrix"
+    name = "ci-matrix"
 
     @property
     def description(self) -> str:
@@ -35,7 +38,9 @@ class CIMatrixCheck(Check):
         issues: list[Issue] = []
         ci_path = self.project_dir / ".github" / "workflows" / "ci.yml"
 
-        if not ci_path.exists():
+        try:
+            content = ci_path.read_text(encoding="utf-8")
+        except OSError:
             issues.append(
                 Issue(
                     check=self.name,
@@ -50,8 +55,6 @@ class CIMatrixCheck(Check):
             )
             return CheckResult(check=self.name, passed=False, issues=issues)
 
-        content = ci_path.read_text(encoding="utf-8")
-
         # A canon shim delegates the matrix to the reusable workflow.
         if CANON_SHIM_MARKER in content:
             return CheckResult(check=self.name, passed=True, issues=[])
@@ -71,18 +74,19 @@ class CIMatrixCheck(Check):
             )
             return CheckResult(check=self.name, passed=True, issues=issues)
 
-        ci_versions = self._matrix_python_versions(ci_path, issues)
+        ci_versions = self._matrix_python_versions(content, issues)
         if issues and any(i.severity == Severity.ERROR for i in issues):
             return CheckResult(check=self.name, passed=False, issues=issues)
 
         if floor not in ci_versions:
+            matrix = sorted(ci_versions, key=_version_key)
             issues.append(
                 Issue(
                     check=self.name,
                     severity=Severity.WARNING,
                     description=(
                         f"ci.yml is not a py-canon shim and its matrix "
-                        f"{sorted(ci_versions) or '(empty)'} does not test the "
+                        f"{matrix or '(empty)'} does not test the "
                         f"requires-python floor {floor}"
                     ),
                     file=Path(".github/workflows/ci.yml"),
@@ -104,8 +108,7 @@ class CIMatrixCheck(Check):
         if not pyproject_path.exists():
             return None
         try:
-            with pyproject_path.open("rb") as f:
-                data = tomllib.load(f)
+            data = load_pyproject(pyproject_path)
         except (OSError, tomllib.TOMLDecodeError):
             return None
         requires = data.get("project", {}).get("requires-python", "")
@@ -114,11 +117,11 @@ class CIMatrixCheck(Check):
             return None
         return f"{match.group(1)}.{match.group(2)}"
 
-    def _matrix_python_versions(self, ci_path: Path, issues: list[Issue]) -> set[str]:
+    def _matrix_python_versions(self, content: str, issues: list[Issue]) -> set[str]:
         """Extract all python-version matrix entries from the workflow.
 
         Args:
-            ci_path: Path to the ci.yml workflow file.
+            content: Text of the ci.yml workflow file.
             issues: Issue list to append parse errors to.
 
         Returns:
@@ -126,8 +129,7 @@ class CIMatrixCheck(Check):
         """
         versions: set[str] = set()
         try:
-            with ci_path.open("r", encoding="utf-8") as f:
-                workflow = yaml.safe_load(f) or {}
+            workflow = yaml.safe_load(content) or {}
         except yaml.YAMLError as exc:
             issues.append(
                 Issue(
@@ -12,10 +12,7 @@ REQUIRED_KEYS = ("cff-version", "title", "authors")
 class CitationCheck(Check):
     """Check that CITATION.cff exists and parses as a plausible CFF file."""
 
-    @property
-    def name(self) -> str:
-        """Return the name of this check."""
-        return "citation"
+    name = "citation"
 
     @property
     def description(self) -> str:
@@ -31,7 +28,9 @@ class CitationCheck(Check):
         issues: list[Issue] = []
         citation_path = self.project_dir / "CITATION.cff"
 
-        if not citation_path.exists():
+        try:
+            text = citation_path.read_text(encoding="utf-8")
+        except OSError:
             issues.append(
                 Issue(
                     check=self.name,
@@ -48,7 +47,7 @@ class CitationCheck(Check):
             return CheckResult(check=self.name, passed=False, issues=issues)
 
         try:
-            data = yaml.safe_load(citation_path.read_text(encoding="utf-8"))
+            data = yaml.safe_load(text)
         except yaml.YAMLError as exc:
             issues.append(
                 Issue(
@@ -11,10 +11,7 @@ from .base import Check, CheckResult, Fix, Impact, Issue, Severity
 class CodespellCheck(Check):
     """Check for spelling errors in documentation and comments using codespell."""
 
-    @property
-    def name(self) -> str:
-        """Return the name of this check."""
-        return "codespell"
+    name = "codespell"
 
     @property
     def description(self) -> str:
@@ -8,10 +8,7 @@ from .base import Check, CheckResult, Fix, Issue, Severity
 class DepsCheck(Check):
     """Check for unused/missing dependencies using deptry."""
 
-    @property
-    def name(self) -> str:
-        """Return the name of this check."""
-        return "deps"
+    name = "deps"
 
     @property
     def description(self) -> str:
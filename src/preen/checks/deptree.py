@@ -9,10 +9,7 @@ from .base import Check, CheckResult, Impact, Issue, Severity
 class DeptreeCheck(Check):
     """Check for circular dependencies in Python code."""
 
-    @property
-    def name(self) -> str:
-        """Return the name of this check."""
-        return "deptree"
+    name = "deptree"
 
     @property
     def description(self) -> str:
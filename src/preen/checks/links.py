@@ -45,10 +45,7 @@ class LinkCheck(Check):
         "your-domain.com",
     }
 
-    @property
-    def name(self) -> str:
-        """Return the name of this check."""
-        return "links"
+    name = "links"
 
     @property
     def description(self) -> str:
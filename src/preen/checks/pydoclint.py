@@ -11,10 +11,7 @@ from .base import Check, CheckResult, Impact, Issue, Severity
 class PydoclintCheck(Check):
     """Check for docstring quality and completeness using pydoclint."""
 
-    @property
-    def name(self) -> str:
-        """Return the name of this check."""
-        return "pydoclint"
+    name = "pydoclint"
 
     @property
     def description(self) -> str:
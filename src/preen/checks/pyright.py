@@ -11,10 +11,7 @@ from .base import Check, CheckResult, Impact, Issue, Severity
 class PyrightCheck(Check):
     """Check for type errors and warnings using pyright static type checker."""
 
-    @property
-    def name(self) -> str:
-        """Return the name of this check."""
-        return "pyright"
+    name = "pyright"
 
     @property
     def description(self) -> str:
@@ -8,10 +8,7 @@ from .base import Check, CheckResult, Fix, Impact, Issue, Severity
 class RuffCheck(Check):
     """Check for linting and formatting issues using ruff."""
 
-    @property
-    def name(self) -> str:
-        """Return the name of this check."""
-        return "ruff"
+    name = "ruff"
 
     @property
     def description(self) -> str:
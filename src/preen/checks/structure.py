@@ -4,17 +4,14 @@ import fnmatch
 import subprocess
 from pathlib import Path
 
-from ..config import PreenConfig
+from ..config import PreenConfig, load_pyproject
 from .base import Check, CheckResult, Fix, Impact, Issue, Severity
 
 
 class StructureCheck(Check):
     """Check project structure follows opinionated best practices."""
 
-    @property
-    def name(self) -> str:
-        """Return the name of this check."""
-        return "structure"
+    name = "structure"
 
     @property
     def description(self) -> str:
@@ -127,13 +124,7 @@ class StructureCheck(Check):
             # Check if package is at root (flat layout)
             pyproject_path = self.project_dir / "pyproject.toml"
             if pyproject_path.exists():
-                try:
-                    import tomllib
-                except ImportError:
-                    import tomli as tomllib  # type: ignore
-
-                with pyproject_path.open("rb") as f:
-                    data = tomllib.load(f)
+                data = load_pyproject(pyproject_path)
 
                 package_name = data.get("project", {}).get("name", "")
                 if package_name and (self.project_dir / package_name).exists():
@@ -69,10 +69,7 @@ def latest_canon_tag(url: str = CANON_URL, timeout: float = 10.0) -> str | None:
 class TemplateCheck(Check):
     """Check that the repo is adopted from py-canon and tracks its latest tag."""
 
-    @property
-    def name(self) -> str:
-        """Return the name of this check."""
-        return "template"
+    name = "template"
 
     @property
     def description(self) -> str:
@@ -8,10 +8,7 @@ from .base import Check, CheckResult, Issue, Severity
 class TestsCheck(Check):
     """Run pytest and report results."""
 
-    @property
-    def name(self) -> str:
-        """Return the name of this check."""
-        return "tests"
+    name = "tests"
 
     @property
     def description(self) -> str:
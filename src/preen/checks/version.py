@@ -10,31 +10,31 @@ import re
 import tomllib
 from pathlib import Path
 
+from ..config import load_pyproject
 from .base import Check, CheckResult, Impact, Issue, Severity
 
 _LITERAL_VERSION = re.compile(
     r"""^\s*__version__\s*=\s*["']\d+[^"']*["']""", re.MULTILINE
 )
 
-EXCLUDE_PARTS = {
-    ".git",
-    "__pycache__",
-    ".venv",
-    ".env",
-    "build",
-    "dist",
-    "node_modules",
-    ".eggs",
-}
+EXCLUDE_PARTS = frozenset(
+    {
+        ".git",
+        "__pycache__",
+        ".venv",
+        ".env",
+        "build",
+        "dist",
+        "node_modules",
+        ".eggs",
+    }
+)
 
 
 class VersionCheck(Check):
     """Check for hardcoded version strings outside pyproject.toml."""
 
-    @property
-    def name(self) -> str:
-        """Return the name of this check."""
-        return "version"
+    name = "version"
 
     @property
     def description(self) -> str:
@@ -83,8 +83,7 @@ class VersionCheck(Check):
         if not pyproject_path.exists():
             return None
         try:
-            with pyproject_path.open("rb") as f:
-                data = tomllib.load(f)
+            data = load_pyproject(pyproject_path)
         except (OSError, tomllib.TOMLDecodeError):
             return None
         return data.get("project", {}).get("version")
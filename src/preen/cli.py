@@ -4,21 +4,14 @@ Preen is the conformance-and-adoption CLI for the py-canon fleet standard:
 scaffold new packages (``new``), retrofit existing ones (``adopt``), pull
 template updates (``update``), check conformance (``check``), apply fixes
 (``fix``), and cut tag-driven releases (``release``).
+
+Command implementations are imported inside each command so that ``--help``
+and the lightweight commands don't pay for loading the whole check suite.
 """
 
 from pathlib import Path
 
 import typer
-from rich.console import Console
-from rich.table import Table
-
-from .checks import ALL_CHECKS, Impact, run_checks
-from .commands.adopt import run_adopt
-from .commands.fix import apply_fixes
-from .commands.new import new_package
-from .commands.release import release_package
-from .commands.update import run_update
-from .interactive import EducationalPrompt
 
 app = typer.Typer(
     help="Preen — conformance and adoption CLI for the py-canon fleet standard",
@@ -26,6 +19,18 @@ app = typer.Typer(
 )
 
 
+def _resolve_project_dir(path: str | None) -> Path:
+    """Return the directory a command operates on.
+
+    Args:
+        path: Path given on the command line, if any.
+
+    Returns:
+        ``path`` as a Path, or the current directory when omitted.
+    """
+    return Path(path) if path else Path.cwd()
+
+
 @app.command()
 def new(
     name: str = typer.Argument(..., help="Project name (also the directory created)."),
@@ -42,6 +47,8 @@ def new(
     ),
 ) -> None:
     """Scaffold a new package from the py-canon copier template."""
+    from .commands.new import new_package
+
     new_package(name, org=org, description=description, cli=cli)
 
 
@@ -63,7 +70,9 @@ def adopt(
     template, copies in only the managed files, and rewrites the [tool.*]
     sections of pyproject.toml to the fleet standard.
     """
-    repo = Path(path) if path else Path.cwd()
+    from .commands.adopt import run_adopt
+
+    repo = _resolve_project_dir(path)
     run_adopt(repo, release_migration=release_migration)
 
 
@@ -74,7 +83,9 @@ def update(
     ),
 ) -> None:
     """Update an adopted repo to the latest py-canon template version."""
-    repo = Path(path) if path else Path.cwd()
+    from .commands.update import run_update
+
+    repo = _resolve_project_dir(path)
     run_update(repo)
 
 
@@ -96,7 +107,13 @@ def check(
     ),
 ) -> None:
     """Run conformance checks on the package (pure detection, no fixing)."""
-    project_dir = Path(path) if path else Path.cwd()
+    from rich.console import Console
+    from rich.table import Table
+
+    from .checks import ALL_CHECKS, Impact, run_checks
+    from .interactive import EducationalPrompt, buffered_output
+
+    project_dir = _resolve_project_dir(path)
     console = Console()
 
     console.print(
@@ -116,65 +133,86 @@ def check(
     has_errors = False
     critical_count = 0
     important_count = 0
+    rows: list[tuple[str, str, str, str]] = []
+
+    # Locals for names the loops below read on every iteration
+    add_row = rows.append
+    critical_impact = Impact.CRITICAL
+    important_impact = Impact.IMPORTANT
 
     for check_name, result in results.items():
         if result.passed:
-            status = "[green]passed[/green]"
-            issue_text = ""
-            impact_text = ""
+            add_row((check_name, "[green]passed[/green]", "", ""))
+            continue
+
+        # One pass over the issues for the impact tallies
+        critical = important = 0
+        for issue in result.issues:
+            impact = issue.impact
+            if impact is critical_impact:
+                critical += 1
+            elif impact is important_impact:
+                important += 1
+
+        if result.has_errors:
+            status = "[red]failed[/red]"
+            has_errors = True
         else:
-            if result.has_errors:
-                status = "[red]failed[/red]"
-                has_errors = True
-            else:
-                status = "[yellow]warning[/yellow]"
-
-            issue_count = len(result.issues)
-            total_issues += issue_count
-            issue_text = f"{issue_count} issue{'s' if issue_count != 1 else ''}"
-
-            critical = len(result.get_issues_by_impact(Impact.CRITICAL))
-            important = len(result.get_issues_by_impact(Impact.IMPORTANT))
-            critical_count += critical
-            important_count += important
-
-            impact_parts = []
-            if critical > 0:
-                impact_parts.append(f"[red]{critical} critical[/red]")
-            if important > 0:
-                impact_parts.append(f"[yellow]{important} important[/yellow]")
-            impact_text = (
-                ", ".join(impact_parts) if impact_parts else "[blue]info only[/blue]"
-            )
+            status = "[yellow]warning[/yellow]"
+
+        issue_count = len(result.issues)
+        total_issues += issue_count
+        issue_text = f"{issue_count} issue{'s' if issue_count != 1 else ''}"
 
-        table.add_row(check_name, status, issue_text, impact_text)
+        critical_count += critical
+        important_count += important
 
-    console.print(table)
+        impact_parts = []
+        if critical > 0:
+            impact_parts.append(f"[red]{critical} critical[/red]")
+        if important > 0:
+            impact_parts.append(f"[yellow]{important} important[/yellow]")
+        impact_text = (
+            ", ".join(impact_parts) if impact_parts else "[blue]info only[/blue]"
+        )
 
-    if total_issues == 0:
-        console.print("\n[bold green]All checks passed.[/bold green]\n")
-    else:
-        console.print(f"\n[bold]Found {total_issues} issue(s)[/bold]")
-        if critical_count > 0:
-            console.print(f"  {critical_count} critical (blocks release)")
-        if important_count > 0:
-            console.print(f"  {important_count} important (can override)")
+        add_row((check_name, status, issue_text, impact_text))
 
-        for check_name, result in results.items():
-            if not result.passed:
+    for row in rows:
+        table.add_row(*row)
+
+    with buffered_output(console):
+        console.print(table)
+
+        if total_issues == 0:
+            console.print("\n[bold green]All checks passed.[/bold green]\n")
+        else:
+            console.print(f"\n[bold]Found {total_issues} issue(s)[/bold]")
+            if critical_count > 0:
+                console.print(f"  {critical_count} critical (blocks release)")
+            if important_count > 0:
+                console.print(f"  {important_count} important (can override)")
+
+            print_line = console.print
+            for check_name, result in results.items():
+                if result.passed:
+                    continue
+                issues = result.issues
                 if explain:
-                    educator.explain_check(check_name, result.issues)
+                    educator.explain_check(check_name, issues)
                 else:
-                    for issue in result.issues:
-                        console.print(f"  {issue}")
+                    for issue in issues:
+                        print_line(f"  {issue}")
 
-        console.print("\n[bold blue]Next steps:[/bold blue]")
-        console.print("  - Run [cyan]preen fix[/cyan] to apply automatic fixes")
-        console.print("  - Run [cyan]preen release[/cyan] for the guided release flow")
-        if not explain:
+            console.print("\n[bold blue]Next steps:[/bold blue]")
+            console.print("  - Run [cyan]preen fix[/cyan] to apply automatic fixes")
             console.print(
-                "  - Use [cyan]--explain[/cyan] to understand why issues matter"
+                "  - Run [cyan]preen release[/cyan] for the guided release flow"
             )
+            if not explain:
+                console.print(
+                    "  - Use [cyan]--explain[/cyan] to understand why issues matter"
+                )
 
     # Informational issues are suggestions; they never gate CI
     if strict and (critical_count > 0 or important_count > 0 or has_errors):
@@ -200,7 +238,9 @@ def fix(
     ),
 ) -> None:
     """Apply fixes for issues found by checks."""
-    project_dir = Path(path) if path else Path.cwd()
+    from .commands.fix import apply_fixes
+
+    project_dir = _resolve_project_dir(path)
     apply_fixes(
         project_dir=project_dir,
         check_name=check_name,
@@ -229,7 +269,9 @@ def release(
     The pushed vX.Y.Z tag triggers the repo's release workflow (build,
     attestations, trusted publishing, GitHub Release).
     """
-    project_dir = Path(path) if path else Path.cwd()
+    from .commands.release import release_package
+
+    project_dir = _resolve_project_dir(path)
     release_package(
         project_dir=project_dir,
         version=version,
@@ -6,6 +6,7 @@ import typer
 from rich.console import Console
 
 from ..adopt import AdoptionReport, adopt_repo
+from ..interactive import buffered_output
 
 
 def run_adopt(
@@ -34,33 +35,34 @@ def run_adopt(
         console.print(f"[red]{exc}[/red]")
         raise typer.Exit(code=1) from exc
 
-    console.print("\n[bold cyan]ADOPTION REPORT[/bold cyan]")
+    with buffered_output(console):
+        console.print("\n[bold cyan]ADOPTION REPORT[/bold cyan]")
 
-    console.print("\n[bold]Written:[/bold]")
-    if report.written:
-        for item in report.written:
-            console.print(f"  [green]+[/green] {item}")
-    else:
-        console.print("  (nothing)")
+        console.print("\n[bold]Written:[/bold]")
+        if report.written:
+            for item in report.written:
+                console.print(f"  [green]+[/green] {item}")
+        else:
+            console.print("  (nothing)")
 
-    console.print("\n[bold]Skipped:[/bold]")
-    if report.skipped:
-        for item in report.skipped:
-            console.print(f"  [dim]-[/dim] {item}")
-    else:
-        console.print("  (nothing)")
+        console.print("\n[bold]Skipped:[/bold]")
+        if report.skipped:
+            for item in report.skipped:
+                console.print(f"  [dim]-[/dim] {item}")
+        else:
+            console.print("  (nothing)")
 
-    console.print("\n[bold]pyproject.toml:[/bold]")
-    for item in report.pyproject_changes:
-        console.print(f"  [yellow]~[/yellow] {item}")
+        console.print("\n[bold]pyproject.toml:[/bold]")
+        for item in report.pyproject_changes:
+            console.print(f"  [yellow]~[/yellow] {item}")
 
-    if report.todos:
-        console.print("\n[bold]Manual TODOs:[/bold]")
-        for item in report.todos:
-            console.print(f"  [red]![/red] {item}")
+        if report.todos:
+            console.print("\n[bold]Manual TODOs:[/bold]")
+            for item in report.todos:
+                console.print(f"  [red]![/red] {item}")
 
-    console.print(
-        "\nRun [cyan]uv lock && uv sync --all-groups[/cyan], then "
-        "[cyan]preen check[/cyan] to see where the repo stands."
-    )
+        console.print(
+            "\nRun [cyan]uv lock && uv sync --all-groups[/cyan], then "
+            "[cyan]preen check[/cyan] to see where the repo stands."
+        )
     return report
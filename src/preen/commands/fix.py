@@ -32,12 +32,12 @@ def apply_fixes(
     check_classes = ALL_CHECKS
 
     if check_name:
-        available = {cls(project_dir).name: cls for cls in ALL_CHECKS}
+        available = {cls.name: cls for cls in ALL_CHECKS}
         if check_name not in available:
             console.print(f"[red]Unknown check: {check_name}[/red]")
             console.print(f"Available checks: {', '.join(sorted(available))}")
             raise typer.Exit(1)
-        check_classes = [available[check_name]]
+        check_classes = (available[check_name],)
 
     results = run_checks(project_dir, check_classes)
 
@@ -1,11 +1,47 @@
 """Configuration for preen, read from pyproject.toml's ``[tool.preen]`` section."""
 
+import copy
 import tomllib
-from dataclasses import dataclass, field
+from dataclasses import dataclass, fields
 from pathlib import Path
+from typing import Any
 
+# Parsed pyproject.toml files keyed by path, stored with the (mtime_ns, size)
+# they were parsed at. Several checks read the same file during one run; an
+# edit replaces the entry rather than adding another.
+_PYPROJECT_CACHE: dict[str, tuple[int, int, dict[str, Any]]] = {}
 
-@dataclass
+
+def load_pyproject(path: Path) -> dict[str, Any]:
+    """Parse a pyproject.toml, reusing an earlier parse of the same file.
+
+    Args:
+        path: Path to the pyproject.toml file.
+
+    Returns:
+        The parsed TOML document. Callers get their own copy and may mutate it.
+
+    Raises:
+        OSError: If the file cannot be read.
+        tomllib.TOMLDecodeError: If the file is not valid TOML.
+    """
+    st = path.stat()
+    key = str(path)
+    entry = _PYPROJECT_CACHE.get(key)
+    if entry is not None and entry[:2] == (st.st_mtime_ns, st.st_size):
+        data = entry[2]
+    else:
+        data = tomllib.loads(path.read_bytes().decode("utf-8"))
+        _PYPROJECT_CACHE[key] = (st.st_mtime_ns, st.st_size, data)
+    return copy.deepcopy(data)
+
+
+def clear_pyproject_cache() -> None:
+    """Forget all cached pyproject.toml parses (e.g. after rewriting one)."""
+    _PYPROJECT_CACHE.clear()
+
+
+@dataclass(slots=True)
 class PreenConfig:
     """Configuration for preen behavior."""
 
@@ -14,8 +50,8 @@ class PreenConfig:
     tests_at_root: bool = True
     examples_at_root: bool = True
 
-    # Checks
-    skip_checks: list[str] = field(default_factory=list)
+    # Checks (immutable, so the default is shared rather than rebuilt)
+    skip_checks: tuple[str, ...] = ()
 
     @classmethod
     def from_pyproject(cls, project_dir: Path) -> "PreenConfig":
@@ -33,13 +69,18 @@ class PreenConfig:
         if not pyproject_path.exists():
             return config
 
-        with pyproject_path.open("rb") as f:
-            data = tomllib.load(f)
+        data = load_pyproject(pyproject_path)
 
         tool_config = data.get("tool", {}).get("preen", {})
 
+        # Only declared fields override; unknown keys are ignored
         for key, value in tool_config.items():
-            if hasattr(config, key):
+            if key in _FIELD_NAMES:
+                if isinstance(value, list):
+                    value = tuple(value)
                 setattr(config, key, value)
 
         return config
+
+
+_FIELD_NAMES = frozenset(f.name for f in fields(PreenConfig))
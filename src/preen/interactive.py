@@ -1,5 +1,8 @@
 """Interactive prompt system for release workflow."""
 
+from collections.abc import Iterator
+from contextlib import contextmanager
+
 from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Confirm, Prompt
@@ -180,3 +183,18 @@ class EducationalPrompt:
         for issue in issues:
             symbol = issue.get_impact_symbol()
             self.console.print(f"  {symbol} {issue.description}")
+
+
+@contextmanager
+def buffered_output(console: Console) -> Iterator[None]:
+    """Hold everything printed to ``console`` and emit it in a single write.
+
+    Args:
+        console: The console whose output is buffered.
+
+    Yields:
+        Nothing; print to ``console`` inside the block.
+    """
+    with console.capture() as capture:
+        yield
+    console.file.write(capture.get())
@@ -83,6 +83,18 @@ def test_docs_conf_backed_up(rendered: Path, repo: Path) -> None:
     assert (repo / "docs" / "conf.py.bak").read_text() == "old conf\n"
 
 
+def test_identical_managed_files_left_alone(rendered: Path, repo: Path) -> None:
+    copy_managed_files(rendered, repo, "mypkg", AdoptionReport())
+
+    report = AdoptionReport()
+    copy_managed_files(rendered, repo, "mypkg", report)
+
+    assert ".github/workflows/ci.yml (unchanged)" in report.skipped
+    assert "docs/conf.py (unchanged)" in report.skipped
+    assert not (repo / "docs" / "conf.py.bak").exists()
+    assert ".github/workflows/ci.yml" not in report.written
+
+
 def test_py_typed_src_layout(rendered: Path, repo: Path) -> None:
     report = AdoptionReport()
     copy_managed_files(rendered, repo, "mypkg", report)
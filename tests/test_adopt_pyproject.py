@@ -155,3 +155,15 @@ def test_release_migration_src_layout(tmp_path: Path) -> None:
 def test_missing_pyproject_raises(tmp_path: Path) -> None:
     with pytest.raises(FileNotFoundError):
         rewrite_pyproject(tmp_path)
+
+
+def test_rewrite_is_idempotent_on_disk(legacy_repo: Path) -> None:
+    rewrite_pyproject(legacy_repo)
+    pyproject = legacy_repo / "pyproject.toml"
+    before = pyproject.stat().st_mtime_ns
+    first = pyproject.read_bytes()
+
+    rewrite_pyproject(legacy_repo)
+
+    assert pyproject.read_bytes() == first
+    assert pyproject.stat().st_mtime_ns == before
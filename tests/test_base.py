@@ -0,0 +1,73 @@
+"""Tests for the check framework's base classes and check list."""
+
+from pathlib import Path
+
+import pytest
+
+from preen.checks import ALL_CHECKS
+from preen.checks.base import Check, CheckResult, Issue, Severity
+
+
+def test_check_result_severity_counts() -> None:
+    result = CheckResult(
+        check="x",
+        passed=False,
+        issues=[Issue(check="x", severity=Severity.WARNING, description="w")],
+    )
+    assert result.has_warnings
+    assert not result.has_errors
+    result.add_issue(Issue(check="x", severity=Severity.ERROR, description="e"))
+    assert result.has_errors
+    assert len(result.issues) == 2
+
+
+def test_issue_str() -> None:
+    issue = Issue(
+        check="ruff",
+        severity=Severity.WARNING,
+        description="bad",
+        file=Path("a.py"),
+        line=3,
+    )
+    assert str(issue) == "[warning] ruff: bad in a.py:3"
+    assert str(Issue(check="x", severity=Severity.ERROR, description="d")) == (
+        "[error] x: d"
+    )
+
+
+def test_severity_labels_and_issue_str() -> None:
+    expected = {
+        Severity.ERROR: "error",
+        Severity.WARNING: "warning",
+        Severity.INFO: "info",
+    }
+    for severity, label in expected.items():
+        assert severity.label == label
+        issue = Issue(check="x", severity=severity, description="d")
+        assert str(issue) == f"[{label}] x: d"
+
+
+def test_all_checks_report_order() -> None:
+    assert [cls.name for cls in ALL_CHECKS] == [
+        "template",
+        "ruff",
+        "tests",
+        "citation",
+        "deps",
+        "deptree",
+        "ci-matrix",
+        "structure",
+        "version",
+        "links",
+        "pydoclint",
+        "pyright",
+        "codespell",
+    ]
+
+
+def test_concrete_check_without_name_is_rejected() -> None:
+    with pytest.raises(TypeError, match="name"):
+
+        class _Nameless(Check):
+            def run(self) -> CheckResult:
+                return CheckResult(check="", passed=True)
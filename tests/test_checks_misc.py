@@ -63,12 +63,28 @@ def test_ci_matrix_missing_floor_fails(tmp_path: Path) -> None:
     assert any("3.11" in issue.description for issue in result.issues)
 
 
+def test_ci_matrix_versions_listed_numerically(tmp_path: Path) -> None:
+    _write_pyproject(tmp_path, floor="3.8")
+    _write_ci(tmp_path, CUSTOM_MATRIX.format(versions='3.10", "3.9'))
+    result = CIMatrixCheck(tmp_path).run()
+    assert "['3.9', '3.10']" in result.issues[0].description
+
+
 def test_ci_matrix_missing_workflow(tmp_path: Path) -> None:
     _write_pyproject(tmp_path)
     result = CIMatrixCheck(tmp_path).run()
     assert not result.passed
 
 
+def test_ci_matrix_workflows_path_is_a_file(tmp_path: Path) -> None:
+    _write_pyproject(tmp_path)
+    (tmp_path / ".github").mkdir()
+    (tmp_path / ".github" / "workflows").write_text("")
+    result = CIMatrixCheck(tmp_path).run()
+    assert not result.passed
+    assert "No CI workflow found" in result.issues[0].description
+
+
 def test_citation_missing(tmp_path: Path) -> None:
     result = CitationCheck(tmp_path).run()
     assert not result.passed
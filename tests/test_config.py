@@ -0,0 +1,38 @@
+"""Tests for preen configuration and the pyproject.toml parse cache."""
+
+from pathlib import Path
+
+from preen import config
+from preen.config import PreenConfig, load_pyproject
+
+
+def test_load_pyproject_sees_edits(tmp_path: Path) -> None:
+    pyproject = tmp_path / "pyproject.toml"
+    pyproject.write_text('[project]\nname = "a"\n')
+    assert load_pyproject(pyproject)["project"]["name"] == "a"
+    entries = len(config._PYPROJECT_CACHE)
+    pyproject.write_text('[project]\nname = "bb"\n')
+    assert load_pyproject(pyproject)["project"]["name"] == "bb"
+    # The edit replaced the stale entry instead of adding a second one
+    assert len(config._PYPROJECT_CACHE) == entries
+
+
+def test_load_pyproject_returns_independent_copies(tmp_path: Path) -> None:
+    pyproject = tmp_path / "pyproject.toml"
+    pyproject.write_text('[project]\nname = "a"\n')
+    load_pyproject(pyproject)["project"]["name"] = "mutated"
+    assert load_pyproject(pyproject)["project"]["name"] == "a"
+
+
+def test_from_pyproject_reads_tool_preen(tmp_path: Path) -> None:
+    (tmp_path / "pyproject.toml").write_text(
+        '[tool.preen]\nsrc_layout = false\nskip_checks = ["ruff"]\nunknown_key = 1\n'
+    )
+    config = PreenConfig.from_pyproject(tmp_path)
+    assert config.src_layout is False
+    assert config.skip_checks == ("ruff",)
+    assert config.tests_at_root is True
+
+
+def test_preen_config_has_no_instance_dict() -> None:
+    assert not hasattr(PreenConfig(), "__dict__")
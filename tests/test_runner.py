@@ -0,0 +1,37 @@
+"""Tests for the check runner."""
+
+import time
+from pathlib import Path
+
+from preen.checks.base import Check, CheckResult
+from preen.checks.runner import run_checks
+
+
+class _SlowCheck(Check):
+    name = "slow"
+
+    def run(self) -> CheckResult:
+        time.sleep(0.05)
+        return CheckResult(check=self.name, passed=True)
+
+
+class _FastCheck(Check):
+    name = "fast"
+
+    def run(self) -> CheckResult:
+        return CheckResult(check=self.name, passed=True)
+
+
+def test_results_keep_declared_order(tmp_path: Path) -> None:
+    results = run_checks(tmp_path, [_SlowCheck, _FastCheck])
+    assert list(results) == ["slow", "fast"]
+    assert results["slow"].duration >= 0.05
+
+
+def test_skip_and_only(tmp_path: Path) -> None:
+    assert list(run_checks(tmp_path, [_SlowCheck, _FastCheck], skip=["slow"])) == [
+        "fast"
+    ]
+    assert list(run_checks(tmp_path, [_SlowCheck, _FastCheck], only=["slow"])) == [
+        "slow"
+    ]